@@ -1,57 +1,193 @@
-from flask import Flask, render_template, request, flash
-from processor import process_input
-import os, json
+from quart import Quart, render_template, request, flash, jsonify, abort
+from celery import Celery
+from celery.result import AsyncResult
+from processor import process_input, is_url
+import os
+import asyncio
+import orjson
 from llm_as_fact_checker import llm_fact_checker
 from claim_processing import claim_extraction
 from google_fact_check import claim_search_google_api
 from claim_processing import claim_worthiness
-import ast
 
-app = Flask(__name__)
+app = Quart(__name__)
 app.secret_key = os.environ.get("FLASK_SECRET_KEY", "dev-secret")
 
+# With CELERY_BROKER_URL set the pipeline runs on Celery workers and the page
+# polls for the result. Without it the (async) view awaits the pipeline itself;
+# its network-bound stages overlap on the event loop instead of blocking a worker.
+CELERY_BROKER_URL = os.environ.get("CELERY_BROKER_URL")
+USE_CELERY = bool(CELERY_BROKER_URL)
+
+celery = Celery(
+    app.name,
+    broker=CELERY_BROKER_URL or "redis://localhost:6379/0",
+    backend=os.environ.get("CELERY_RESULT_BACKEND", CELERY_BROKER_URL or "redis://localhost:6379/0"),
+)
+
+# Queues, one worker pool each so jobs that fetch pages/captions first don't
+# hold up plain-text ones:
+#   celery -A app.celery worker -Q llm -c 8
+#   celery -A app.celery worker -Q web -c 8
+QUEUE_LLM = "llm"
+QUEUE_WEB = "web"
+celery.conf.task_default_queue = QUEUE_LLM
+# Running jobs report STARTED, so a job still PENDING long after submission
+# is unknown/expired (or never picked up) rather than merely slow.
+celery.conf.task_track_started = True
+
+# How long the page keeps polling a job that never leaves PENDING
+JOB_PENDING_TIMEOUT_SECONDS = 10 * 60
+
+
+def _queue_for(raw_input: str) -> str:
+    """Pick the queue by input type: URL (article or YouTube captions) -> web, text -> llm."""
+    candidate = raw_input.strip()
+    if is_url(candidate):
+        return QUEUE_WEB
+    return QUEUE_LLM
+
+
+async def _llm_fact_check(text: str, result: dict) -> None:
+    factcheckText = await llm_fact_checker.fact_check_async(text)
+    result["factcheck"] = orjson.loads(factcheckText)
+
+
+async def _tool_fact_check(text: str, result: dict) -> None:
+    # ClaimBuster -> claim extraction -> Google Fact Check (each stage feeds the next)
+    claim_worthy = await claim_worthiness.top_checkworthy_sentences_async(text, api_key=None, top_k=3)
+    result["claim_worthy"] = claim_worthy
+    claims = await claim_extraction.extract_claims_async(text, top_results=claim_worthy)
+    claim_list = orjson.loads(claims)["claims"]
+    print(claim_list)
+    fact_check_groups = await claim_search_google_api.search_fact_checks_many_async(claim_list)
+    # Flatten for the template, which groups reviews by claim itself. Repeated
+    # claims share one result list, and different claims can match the same
+    # review, so keep each (claim, url) once.
+    fact_checks = []
+    seen = set()
+    for group in fact_check_groups:
+        for fc in group:
+            key = (fc["claim"], fc["url"])
+            if key not in seen:
+                seen.add(key)
+                fact_checks.append(fc)
+    print(fact_checks)
+    result["fact_checks"] = fact_checks
+
+
+async def _analyze(text: str, result: dict) -> None:
+    """Run the LLM and tool-based checks concurrently; both only need `text`."""
+    outcomes = await asyncio.gather(
+        _llm_fact_check(text, result),
+        _tool_fact_check(text, result),
+        return_exceptions=True,
+    )
+    # Keep whatever succeeded in `result`, then surface the first failure
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+
+
+async def _run_pipeline_async(raw_input: str) -> dict:
+    """
+    Full pipeline: input -> text -> LLM fact-check, ClaimBuster, Google Fact Check.
+    Returns a JSON-serializable dict with the template context (or an "error").
+    """
+    result = {
+        "raw_input": raw_input,
+        "text": None,
+        "warnings": [],
+        "factcheck": None,
+        "fact_checks": None,
+        "claim_worthy": None,
+    }
+    try:
+        extracted_text, _, w = await asyncio.to_thread(process_input, raw_input)
+        text = extracted_text
+        result["text"] = text
+        await _analyze(text, result)
+
+        result["warnings"] = w
+    except Exception as e:
+        result["error"] = str(e)
+    return result
+
+
+@celery.task(name="pipeline.run")
+def run_pipeline(raw_input: str) -> dict:
+    """Celery entry point for _run_pipeline_async()."""
+    return asyncio.run(_run_pipeline_async(raw_input))
+
+
 @app.route("/", methods=["GET", "POST"])
-def index():
+async def index():
     text = None
     warnings = []
     raw_input = ""
     factcheck = None   # <-- will hold JSON dict
     fact_checks = None
     claim_worthy = None
+    job_id = None
+    data = None
 
     if request.method == "POST":
-        raw_input = request.form.get("user_input", "")
+        form = await request.form
+        raw_input = form.get("user_input", "")
 
-        # 1) Extracted text pipeline
         if raw_input:
-            try:
-                extracted_text, _, w = process_input(raw_input)
-                text = extracted_text
-                factcheckText = llm_fact_checker.fact_check(text)
-                factcheck = json.loads(factcheckText)
-
-                # New
-                claim_worthy = claim_worthiness.top_checkworthy_sentences(text, api_key=None, top_k=3)
-                claims = claim_extraction.extract_claims(text)
-                claim_list = ast.literal_eval(claims)
-                print(claim_list)
-                for claim in claim_list:
-                    fact_checks = claim_search_google_api.search_fact_checks(claim)
-                    print(fact_checks)
-                
-                warnings = w
-            except Exception as e:
-                flash(str(e), "error")
-
-    return render_template(
+            if USE_CELERY:
+                # 1) Hand the pipeline to a worker; the page polls /status/<job_id>
+                task = run_pipeline.apply_async(args=[raw_input], queue=_queue_for(raw_input))
+                job_id = task.id
+            else:
+                # 1) Run it here; the stages overlap on the event loop
+                data = await _run_pipeline_async(raw_input)
+
+    elif USE_CELERY and request.args.get("job"):
+        # 2) Job finished (or failed): render its results
+        res = AsyncResult(request.args["job"], app=celery)
+        if not res.ready():
+            job_id = res.id
+        elif res.successful():
+            data = res.result or {}
+        else:
+            await flash(str(res.result), "error")
+
+    if data is not None:
+        if data.get("error"):
+            await flash(data["error"], "error")
+        raw_input = data.get("raw_input") or ""
+        text = data.get("text")
+        warnings = data.get("warnings") or []
+        factcheck = data.get("factcheck")
+        fact_checks = data.get("fact_checks")
+        claim_worthy = data.get("claim_worthy")
+
+    return await render_template(
         "index.html",
         text=text,
         warnings=warnings,
         raw_input=raw_input,
         factcheck=factcheck,
         fact_checks=fact_checks,
-        claim_worthy = claim_worthy
+        claim_worthy = claim_worthy,
+        job_id=job_id,
+        job_pending_timeout=JOB_PENDING_TIMEOUT_SECONDS
     )
 
+
+@app.route("/status/<job_id>")
+async def status(job_id):
+    if not USE_CELERY:
+        # No broker configured: there are no jobs to report on
+        abort(404)
+    res = AsyncResult(job_id, app=celery)
+    payload = {"id": job_id, "state": res.state, "ready": res.ready()}
+    if res.ready():
+        payload["result"] = res.result if res.successful() else str(res.result)
+    return jsonify(payload)
+
+
 if __name__ == "__main__":
     app.run(host="0.0.0.0", port= 8080)
@@ -1,14 +1,45 @@
+import asyncio
+import hashlib
+import diskcache
+import orjson
 from llm_wrapper import prompt_builder
 from llm_wrapper import llm_inference
 from claim_processing import claim_worthiness
 
+# Extracted claims keyed by a hash of the prompt (i.e. of the check-worthy
+# sentences), so resubmitting the same text skips the LLM round-trip.
+_LLM_CACHE = diskcache.Cache("./.cache/llm")
+_LLM_CACHE_EXPIRE_SECONDS = 7 * 24 * 60 * 60
 
-def check_worth_paragraph(paragraph: str | None):
-    top_results = claim_worthiness.top_checkworthy_sentences(paragraph, api_key=None, top_k=3)
+
+def _cache_key(prompt: str) -> str:
+    # BLAKE2b: fast, and 16 bytes is plenty for a cache key
+    return hashlib.blake2b(prompt.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def check_worth_paragraph(paragraph: str | None, top_results=None):
+    # Reuse ClaimBuster results when the caller already has them (saves a round-trip)
+    if top_results is None:
+        top_results = claim_worthiness.top_checkworthy_sentences(paragraph, api_key=None, top_k=3)
     check_worth_paragraph = [sent for sent, _ in top_results]
     return check_worth_paragraph
 
-def extract_claims(paragraph: str | None):
-    check_worth_paragraph_to_claim = check_worth_paragraph(paragraph)
+def extract_claims(paragraph: str | None, top_results=None):
+    check_worth_paragraph_to_claim = check_worth_paragraph(paragraph, top_results=top_results)
     prompt = prompt_builder.build_prompt_to_extract_Claims(check_worth_paragraph_to_claim)
-    return llm_inference.generate_response_40(prompt)
+
+    key = _cache_key(prompt)
+    claims = _LLM_CACHE.get(key)
+    if claims is None:
+        # Returns a JSON string: {"claims": [...]}
+        claims = llm_inference.generate_response_40(prompt, response_format={"type": "json_object"})
+        # Only cache well-formed replies; a bad one would otherwise fail for a week.
+        # Raises here (orjson.JSONDecodeError / KeyError) exactly as the caller would.
+        orjson.loads(claims)["claims"]
+        _LLM_CACHE.set(key, claims, expire=_LLM_CACHE_EXPIRE_SECONDS)
+    return claims
+
+
+async def extract_claims_async(paragraph: str | None, top_results=None):
+    # The OpenAI call is blocking; run it off the event loop
+    return await asyncio.to_thread(extract_claims, paragraph, top_results=top_results)
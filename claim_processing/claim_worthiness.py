@@ -15,45 +15,77 @@ Notes:
 import os
 import re
 import json
+import asyncio
 import requests
+from functools import lru_cache
 from typing import List, Tuple, Optional
 import nltk
 from nltk.tokenize import sent_tokenize
 from dotenv import load_dotenv
+try:
+    import blingfire  # FST sentence splitter in C; far faster than Punkt
+except ImportError:
+    blingfire = None
 from information_extraction.text_from_web import get_all_text_from_url
+from http_client import SESSION
 
 CLAIMBUSTER_BATCH_URL = "https://idir.uta.edu/claimbuster/api/v2/score/text/sentences/"
 load_dotenv()
 CLAIMBUSTER_API_KEY = os.getenv("CLAIMBUSTER_API_KEY")
 
+_SPLIT_RE = re.compile(r'([.!?])')
+_WS_RE = re.compile(r'\s+')
+
+_PUNKT_READY = False
+
 
 def _ensure_nltk_punkt():        
+    global _PUNKT_READY
+    if _PUNKT_READY:
+        return
     try:
         nltk.data.find("tokenizers/punkt")
     except LookupError:
         nltk.download("punkt", quiet=True)
+    _PUNKT_READY = True
    
 
 def split_into_sentences(text: str) -> List[str]:
     """
-    Split text into sentences. Prefer NLTK if available; else use a regex fallback.
+    Split text into sentences. Prefer blingfire, then NLTK; else use a regex fallback.
     Ensures each sentence ends with a terminal period '.' as required by the API.
     """
     text = text.strip()
     if not text:
         return []
+    return list(_tokenize_cached(text))
+
 
+@lru_cache(maxsize=1024)
+def _tokenize_cached(text: str) -> Tuple[str, ...]:
+    # Tuple return: callers get a fresh list, the cached value stays immutable
+    return tuple(_do_split(text))
+
+
+def _do_split(text: str) -> List[str]:
     sentences: List[str] = []
-    _ensure_nltk_punkt()
-    try:
-        sentences = sent_tokenize(text)
-    except Exception:
-        sentences = []  # fallback to regex below
+    if blingfire is not None:
+        try:
+            sentences = [s for s in blingfire.text_to_sentences(text).split("\n") if s.strip()]
+        except Exception:
+            sentences = []  # fallback to NLTK below
+
+    if not sentences:
+        _ensure_nltk_punkt()
+        try:
+            sentences = sent_tokenize(text)
+        except Exception:
+            sentences = []  # fallback to regex below
 
     if not sentences:
         # Simple regex fallback: split on ., !, ? followed by space or end
         # and keep the delimiter.
-        parts = re.split(r'([.!?])', text)
+        parts = _SPLIT_RE.split(text)
         sentences = []
         for i in range(0, len(parts) - 1, 2):
             s = (parts[i] + parts[i+1]).strip()
@@ -66,7 +98,7 @@ def split_into_sentences(text: str) -> List[str]:
     # Normalize whitespace and ensure trailing period
     normed = []
     for s in sentences:
-        s = re.sub(r'\s+', ' ', s).strip()
+        s = _WS_RE.sub(' ', s).strip()
         if not s:
             continue
         if not s.endswith("."):
@@ -89,11 +121,11 @@ def score_sentences(sentences: List[str], api_key: str) -> List[Tuple[str, float
     headers = {"x-api-key": api_key}
     payload = {"input_text": input_text}
 
-    resp = requests.post(CLAIMBUSTER_BATCH_URL, json=payload, headers=headers, timeout=30)
+    resp = SESSION.post(CLAIMBUSTER_BATCH_URL, json=payload, headers=headers, timeout=30)
     try:
         resp.raise_for_status()
     except requests.HTTPError as e:
-        raise SystemExit(f"ClaimBuster API error: {e} | Body: {resp.text[:500]}")
+        raise RuntimeError(f"ClaimBuster API error: {e} | Body: {resp.text[:500]}") from e
 
     data = resp.json()
 
@@ -122,7 +154,7 @@ def score_sentences(sentences: List[str], api_key: str) -> List[Tuple[str, float
                 if isinstance(k, str) and isinstance(v, (int, float)):
                     results.append((k, float(v)))
     else:
-        raise SystemExit(f"Unexpected API response format: {json.dumps(data)[:500]}")
+        raise RuntimeError(f"Unexpected API response format: {json.dumps(data)[:500]}")
 
     return results
 
@@ -132,7 +164,7 @@ def top_checkworthy_sentences(text: str, api_key: Optional[str] = None, top_k: i
     """
     api_key = api_key or os.getenv("CLAIMBUSTER_API_KEY")
     if not api_key:
-        raise SystemExit("Please set CLAIMBUSTER_API_KEY env var or pass api_key argument.")
+        raise RuntimeError("Please set CLAIMBUSTER_API_KEY env var or pass api_key argument.")
 
     sentences = split_into_sentences(text)
     scored = score_sentences(sentences, api_key)
@@ -140,3 +172,10 @@ def top_checkworthy_sentences(text: str, api_key: Optional[str] = None, top_k: i
     scored.sort(key=lambda x: x[1], reverse=True)
     return scored[:max(0, top_k)]
 
+
+async def top_checkworthy_sentences_async(text: str, api_key: Optional[str] = None, top_k: int = 3) -> List[Tuple[str, float]]:
+    """
+    Async variant of top_checkworthy_sentences(); the blocking HTTP call runs in a thread.
+    """
+    return await asyncio.to_thread(top_checkworthy_sentences, text, api_key, top_k)
+
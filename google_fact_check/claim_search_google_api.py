@@ -1,39 +1,30 @@
 import os
 import time
-import requests
+import asyncio
+import aiohttp
 from dotenv import load_dotenv
+from http_client import SESSION
 
 load_dotenv()
 FACT_CHECK_API_KEY = os.getenv("FACT_CHECK_API_KEY")  # <- add to your .env
 FACTCHECK_ENDPOINT = os.getenv("FACTCHECK_ENDPOINT", "https://factchecktools.googleapis.com/v1alpha1/claims:search")
+MAX_CONCURRENT_REQUESTS = 8  # stay well inside the Google API quota
 
-def search_fact_checks(query, language="en", max_results=5):
-    """
-    Search fact checks using Google's Fact Check Tools API.
-    
-    Args:
-        query (str): The search term or claim to fact-check.
-        language (str): Language code (default: "en").
-        max_results (int): Number of results to return (default: 5).
-        
-    Returns:
-        list: A list of dictionaries containing fact-check info.
-    """
+
+def _build_params(query, language, max_results):
     params = {
         "query": query,
         "languageCode": language,
         "pageSize": max_results,
         "key": FACT_CHECK_API_KEY
     }
-    
-    response = requests.get(FACTCHECK_ENDPOINT, params=params)
-    
-    if response.status_code != 200:
-        raise Exception(f"Error: {response.status_code} - {response.text}")
-    
-    data = response.json()
+    # aiohttp rejects None values; requests silently drops them
+    return {k: v for k, v in params.items() if v is not None}
+
+
+def _parse_fact_checks(data):
     results = []
-    
+
     for claim in data.get("claims", []):
         claim_text = claim.get("text", "No claim text")
         claim_date = claim.get("claimDate", "Unknown date")
@@ -50,6 +41,92 @@ def search_fact_checks(query, language="en", max_results=5):
     
     return results
 
+
+def search_fact_checks(query, language="en", max_results=5):
+    """
+    Search fact checks using Google's Fact Check Tools API.
+    
+    Args:
+        query (str): The search term or claim to fact-check.
+        language (str): Language code (default: "en").
+        max_results (int): Number of results to return (default: 5).
+        
+    Returns:
+        list: A list of dictionaries containing fact-check info.
+    """
+    params = _build_params(query, language, max_results)
+    
+    response = SESSION.get(FACTCHECK_ENDPOINT, params=params)
+    
+    if response.status_code != 200:
+        raise Exception(f"Error: {response.status_code} - {response.text}")
+    
+    return _parse_fact_checks(response.json())
+
+
+async def search_fact_checks_async(session, query, language="en", max_results=5, semaphore=None):
+    """
+    Async variant of search_fact_checks() sharing an aiohttp.ClientSession.
+
+    Args:
+        session (aiohttp.ClientSession): Open session used for the request.
+        query (str): The search term or claim to fact-check.
+        language (str): Language code (default: "en").
+        max_results (int): Number of results to return (default: 5).
+        semaphore (asyncio.Semaphore | None): Optional limit on in-flight requests.
+
+    Returns:
+        list: A list of dictionaries containing fact-check info.
+    """
+    params = _build_params(query, language, max_results)
+
+    async def _get():
+        async with session.get(FACTCHECK_ENDPOINT, params=params) as response:
+            if response.status != 200:
+                raise Exception(f"Error: {response.status} - {await response.text()}")
+            return _parse_fact_checks(await response.json())
+
+    if semaphore is None:
+        return await _get()
+    async with semaphore:
+        return await _get()
+
+
+async def _gather(queries, language, max_results):
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+    async with aiohttp.ClientSession() as session:
+        return await asyncio.gather(*[
+            search_fact_checks_async(session, q, language, max_results, semaphore)
+            for q in queries
+        ])
+
+
+async def search_fact_checks_many_async(queries, language="en", max_results=5):
+    """
+    Run search_fact_checks() for every query concurrently, from a running event loop.
+    Duplicate queries are sent once and their results shared.
+
+    Returns:
+        list: One result list per query, in the same order as `queries`.
+    """
+    if not queries:
+        return []
+    queries = list(queries)
+    unique = list(dict.fromkeys(queries))
+    results = await _gather(unique, language, max_results)
+    by_query = dict(zip(unique, results))
+    return [by_query[q] for q in queries]
+
+
+def search_fact_checks_many(queries, language="en", max_results=5):
+    """
+    Blocking wrapper around search_fact_checks_many_async().
+
+    Returns:
+        list: One result list per query, in the same order as `queries`.
+    """
+    return asyncio.run(search_fact_checks_many_async(queries, language, max_results))
+
 # # Example usage
 # if __name__ == "__main__":
 #     query = "COVID-19 vaccine causes infertility"
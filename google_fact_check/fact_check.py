@@ -2,7 +2,7 @@ import os
 import requests
 from dotenv import load_dotenv
 import json
-import ast
+import orjson
 from claim_processing import claim_extraction
 from google_fact_check import claim_search_google_api
 from information_extraction import youtube_transcriber
@@ -18,13 +18,13 @@ if __name__ == "__main__":
         )
 
     claims = claim_extraction.extract_claims(paragraph)
-    claim_list = ast.literal_eval(claims)
+    claim_list = orjson.loads(claims)["claims"]
     print(claim_list)
 
-    # Run fact check for each claim
-    fact_checks = []
-    for claim in claim_list:
-        fact_checks = claim_search_google_api.search_fact_checks(claim)
+    # Run fact check for each claim (concurrently)
+    fact_check_groups = claim_search_google_api.search_fact_checks_many(claim_list)
+    for claim, fact_checks in zip(claim_list, fact_check_groups):
+        print(f"\n=== {claim}")
         
         if not fact_checks:
             print("No fact checks found.")
@@ -0,0 +1,31 @@
+"""
+Shared HTTP session for outbound API / page requests.
+
+One keep-alive connection pool per process, so repeated calls to the same
+host skip the TCP + TLS handshake. Transient failures (429/5xx) are retried
+with backoff; headers stay per-request and cookies are never kept.
+"""
+
+from http.cookiejar import DefaultCookiePolicy
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_RETRY = Retry(
+    total=3,
+    backoff_factor=0.3,
+    status_forcelist=[429, 500, 502, 503, 504],
+    raise_on_status=False,  # hand the last response back to the caller's own status checks
+    # fetch_html hits user-submitted URLs: a hostile "Retry-After: 3600" must not
+    # park a worker (the sleep isn't covered by timeout=), so use our backoff only
+    respect_retry_after_header=False,
+)
+
+SESSION = requests.Session()
+# Shared by every user's page fetches: never store cookies, so one site's
+# metering/consent/tracking cookies don't pile up or leak into later requests
+SESSION.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+_ADAPTER = HTTPAdapter(pool_connections=32, pool_maxsize=64, max_retries=_RETRY)
+SESSION.mount("https://", _ADAPTER)
+SESSION.mount("http://", _ADAPTER)
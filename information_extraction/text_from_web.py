@@ -4,10 +4,25 @@ import re
 import sys
 from typing import Optional
 
+import charset_normalizer
+import diskcache
 import requests
-from bs4 import BeautifulSoup
 from requests import Response
 
+try:
+    import ahocorasick  # all paywall markers in one linear scan
+except ImportError:
+    ahocorasick = None
+
+try:
+    # lexbor-backed C parser; several times faster than BeautifulSoup + lxml
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+    from bs4 import BeautifulSoup
+
+from http_client import SESSION
+
 # ---- Tunables ---------------------------------------------------------------
 
 BLOCK_TAGS = {
@@ -22,6 +37,31 @@ HIDDEN_SELECTORS = (
 
 MIN_CHARS_PER_LINE = 30  # skip tiny crumbs like menus/toolbars
 
+MAX_HTML_BYTES = 2 * 1024 * 1024  # stop downloading huge pages past this
+FETCH_CHUNK_BYTES = 64 * 1024
+
+CACHE_EXPIRE_SECONDS = 24 * 60 * 60  # re-fetch cached pages after a day
+
+PAYWALL_MARKERS = (
+    "subscribe", "subscription", "subscriber-only", "for subscribers",
+    "log in to continue", "sign in to continue", "metered", "paywall"
+)
+
+_WS_RE = re.compile(r"\s+")
+_ALPHA_RE = re.compile(r"[^\W\d_]")  # any letter, same as str.isalpha()
+
+# Parsed page text (not raw HTML), shared across processes; processor.py
+# caches its article extraction in the same store
+WEB_CACHE = diskcache.Cache("./.cache/web", size_limit=2 << 30)
+
+if ahocorasick is not None:
+    _PAYWALL = ahocorasick.Automaton()
+    for _m in PAYWALL_MARKERS:
+        _PAYWALL.add_word(_m, _m)
+    _PAYWALL.make_automaton()
+else:
+    _PAYWALL = None
+
 DEFAULT_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -41,28 +81,61 @@ class SkippedArticle(Exception):
 
 # ---- Core helpers -----------------------------------------------------------
 
-def _fix_encoding(resp: Response) -> None:
-    """Ensure response.text uses a sensible encoding."""
+def _decode_body(resp: Response, body: bytes) -> str:
+    """Decode body with the declared charset, or a detected one if missing/ISO-8859-1."""
     enc = (resp.encoding or "").lower()
     if not enc or enc == "iso-8859-1":
-        resp.encoding = resp.apparent_encoding
+        best = charset_normalizer.from_bytes(body).best()
+        enc = best.encoding if best is not None else "utf-8"
+    try:
+        return body.decode(enc, errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
 
 
 def fetch_html(url: str, timeout: int = 15) -> str:
-    """Fetch HTML, raising SkippedArticle for common block/paywall statuses."""
-    with requests.Session() as s:
-        s.headers.update(DEFAULT_HEADERS)
-        r = s.get(url, timeout=timeout)
+    """
+    Fetch HTML, raising SkippedArticle for common block/paywall statuses.
+    Reads at most MAX_HTML_BYTES of the body; anything past that is dropped.
+    """
+    r = SESSION.get(url, headers=DEFAULT_HEADERS, timeout=timeout, stream=True)
+    try:
         if r.status_code in {401, 402, 403, 451}:
             # Blocked, paywalled, or legally restricted
             raise SkippedArticle(f"Skipped (HTTP {r.status_code}): access not permitted.")
         r.raise_for_status()
-        _fix_encoding(r)
-        return r.text
 
+        body = bytearray()
+        for chunk in r.iter_content(chunk_size=FETCH_CHUNK_BYTES):
+            body.extend(chunk)
+            if len(body) > MAX_HTML_BYTES:
+                del body[MAX_HTML_BYTES:]
+                break
+    finally:
+        r.close()
+    return _decode_body(r, bytes(body))
 
-def extract_readable_text(html: str) -> str:
-    """Remove boilerplate/hidden elements and return cleaned visible text."""
+
+def _visible_text_selectolax(html: str) -> tuple[str, str]:
+    """Return (flat text, newline-separated text) of the visible page via selectolax."""
+    tree = HTMLParser(html)
+
+    # Remove obvious non-content blocks
+    for tag in tree.css(",".join(sorted(BLOCK_TAGS))):
+        tag.decompose()
+
+    # Remove elements hidden via attributes/inline CSS
+    for el in tree.css(HIDDEN_SELECTORS):
+        el.decompose()
+
+    root = tree.body or tree.root
+    if root is None:
+        return "", ""
+    return root.text(separator=" ", strip=True), root.text(separator="\n")
+
+
+def _visible_text_bs4(html: str) -> tuple[str, str]:
+    """Return (flat text, newline-separated text) of the visible page via BeautifulSoup."""
     soup = BeautifulSoup(html, "lxml")
 
     # Remove obvious non-content blocks
@@ -73,35 +146,48 @@ def extract_readable_text(html: str) -> str:
     for el in soup.select(HIDDEN_SELECTORS):
         el.decompose()
 
+    return soup.get_text(" ", strip=True), soup.get_text(separator="\n")
+
+
+def _has_paywall_marker(page_text: str) -> bool:
+    """True if any PAYWALL_MARKERS phrase occurs (case-insensitive) in page_text."""
+    page_text_lower = page_text.lower()
+    if _PAYWALL is not None:
+        # One pass over the text, stopping at the first hit
+        return next(_PAYWALL.iter(page_text_lower), None) is not None
+    return any(m in page_text_lower for m in PAYWALL_MARKERS)
+
+
+def extract_readable_text(html: str) -> str:
+    """Remove boilerplate/hidden elements and return cleaned visible text."""
+    if HTMLParser is not None:
+        page_text, raw = _visible_text_selectolax(html)
+    else:
+        page_text, raw = _visible_text_bs4(html)
+
     # Quick heuristic: bail if the page is clearly a paywall/tease
-    page_text_lower = soup.get_text(" ", strip=True).lower()
-    paywall_markers = (
-        "subscribe", "subscription", "subscriber-only", "for subscribers",
-        "log in to continue", "sign in to continue", "metered", "paywall"
-    )
-    if any(m in page_text_lower for m in paywall_markers):
+    if _has_paywall_marker(page_text):
         raise SkippedArticle("Skipped: detected paywall copy in page.")
 
-    # Extract and tidy text
-    raw = soup.get_text(separator="\n")
-    lines = [re.sub(r"\s+", " ", ln).strip() for ln in raw.splitlines()]
-    # Keep only lines that look like real content
-    lines = [
-        ln for ln in lines
-        if ln and len(ln) >= MIN_CHARS_PER_LINE and any(c.isalpha() for c in ln)
-    ]
-
-    # Deduplicate consecutive lines
+    # Tidy text in one pass: normalize, keep lines that look like real content,
+    # and drop consecutive duplicates
     deduped = []
-    for ln in lines:
-        if not deduped or ln != deduped[-1]:
-            deduped.append(ln)
+    prev = None
+    for ln in raw.splitlines():
+        ln = _WS_RE.sub(" ", ln).strip()
+        if len(ln) < MIN_CHARS_PER_LINE or _ALPHA_RE.search(ln) is None:
+            continue
+        if ln == prev:
+            continue
+        deduped.append(ln)
+        prev = ln
 
     return "\n".join(deduped)
 
 
+@WEB_CACHE.memoize(expire=CACHE_EXPIRE_SECONDS)
 def get_all_text_from_url(url: str, timeout: int = 15) -> str:
-    """Top-level convenience function."""
+    """Top-level convenience function. Results are cached on disk per URL."""
     html = fetch_html(url, timeout=timeout)
     return extract_readable_text(html)
 
@@ -24,9 +24,13 @@ import os
 import re
 import shutil
 import tempfile
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
+
+import diskcache
 
 __all__ = ["transcribe_youtube"]
 
@@ -35,6 +39,12 @@ logger.addHandler(logging.NullHandler())
 
 _SAFE_CHARS_RE = re.compile(r"[^a-zA-Z0-9._ -]")
 
+_AUDIO_EXTS = frozenset({".webm", ".m4a", ".mp3", ".wav", ".aac", ".opus"})
+
+# Transcripts keyed by (url, engine, model, ...): switching model misses the cache
+_CACHE = diskcache.Cache("./.cache/transcripts", size_limit=2 << 30)
+_CACHE_EXPIRE_SECONDS = 24 * 60 * 60
+
 
 def _sanitize(s: str) -> str:
     s = s.strip().replace("/", "-").replace("\\", "-")
@@ -188,10 +198,12 @@ def _download_audio_to_temp(
         # Fallback: scan for plausible audio outputs in tmp_dir
         title = info_dict.get("title") or ""
         safe_title = _sanitize(title)
-        for f in tmp_dir.glob("*"):
-            if f.suffix.lower() in {".webm", ".m4a", ".mp3", ".wav", ".aac", ".opus"}:
-                if not safe_title or safe_title in f.stem:
-                    return f
+        with os.scandir(tmp_dir) as it:
+            for de in it:
+                stem, ext = os.path.splitext(de.name)
+                if ext.lower() in _AUDIO_EXTS:
+                    if not safe_title or safe_title in stem:
+                        return Path(de.path)
         return None
 
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
@@ -211,6 +223,36 @@ def _download_audio_to_temp(
 
 # ------------------- Engines -------------------
 
+# Quantized types first: INT8 weights halve the bytes the decoder streams.
+# int8_float16 needs a recent GPU; CTranslate2 tells us what the hardware can do.
+_FW_COMPUTE_PREFERENCE = {
+    "cuda": ("int8_float16", "float16"),
+    "cpu": ("int8_float32", "int8"),
+}
+
+_FW_NUM_WORKERS = 2
+
+# Silero VAD (built into faster-whisper), default speech threshold. Splitting on
+# shorter silences and padding speech less cuts more of the gaps out, leaving
+# fewer 30 s windows to decode.
+_FW_VAD_PARAMETERS = dict(
+    min_silence_duration_ms=300,
+    speech_pad_ms=100,
+)
+
+
+def _best_compute_type(device: str, default: str) -> str:
+    try:
+        import ctranslate2  # type: ignore
+        supported = ctranslate2.get_supported_compute_types(device)
+    except Exception:
+        return default
+    for compute_type in _FW_COMPUTE_PREFERENCE.get(device, ()):
+        if compute_type in supported:
+            return compute_type
+    return default
+
+
 def _detect_device_for_faster() -> Tuple[str, str]:
     device, compute_type = "cpu", "int8"
     try:
@@ -219,7 +261,38 @@ def _detect_device_for_faster() -> Tuple[str, str]:
             device, compute_type = "cuda", "float16"
     except Exception:
         pass
-    return device, compute_type
+    return device, _best_compute_type(device, compute_type)
+
+
+# Models are cached per process: loading one costs seconds and hundreds of MB
+# of I/O, so a long-lived worker keeps it resident across jobs.
+
+@lru_cache(maxsize=4)
+def _get_whisper_model(model_size: str, device: str):
+    import whisper  # type: ignore
+    return whisper.load_model(model_size, device=device)
+
+
+@lru_cache(maxsize=4)
+def _get_fw_model(model_size: str, device: str, compute_type: str):
+    from faster_whisper import WhisperModel  # type: ignore
+    return WhisperModel(
+        model_size,
+        device=device,
+        compute_type=compute_type,
+        cpu_threads=os.cpu_count() or 0,  # 0 -> CTranslate2 default
+        num_workers=_FW_NUM_WORKERS,
+    )
+
+
+def _warm_model(engine: str, model_size: str) -> None:
+    """Load the model into the per-process cache (run while the audio downloads)."""
+    if engine == "whisper":
+        import torch  # type: ignore
+        _get_whisper_model(model_size, "cuda" if torch.cuda.is_available() else "cpu")
+    else:
+        device, compute_type = _detect_device_for_faster()
+        _get_fw_model(model_size, device, compute_type)
 
 
 def _transcribe_with_whisper(audio_path: Path, model_size: str) -> str:
@@ -228,7 +301,7 @@ def _transcribe_with_whisper(audio_path: Path, model_size: str) -> str:
     Returns transcript text (English).
     """
     try:
-        import whisper  # type: ignore
+        import whisper  # type: ignore  # noqa: F401
         import torch  # type: ignore
     except ImportError as e:
         raise RuntimeError("openai-whisper is not installed. Run: pip install openai-whisper") from e
@@ -236,7 +309,7 @@ def _transcribe_with_whisper(audio_path: Path, model_size: str) -> str:
     device = "cuda" if torch.cuda.is_available() else "cpu"
     fp16 = device == "cuda"
 
-    model = whisper.load_model(model_size, device=device)
+    model = _get_whisper_model(model_size, device)
     result = model.transcribe(
         str(audio_path),
         task="translate",  # -> English
@@ -246,29 +319,40 @@ def _transcribe_with_whisper(audio_path: Path, model_size: str) -> str:
     return (result.get("text") or "").strip()
 
 
-def _transcribe_with_faster_whisper(audio_path: Path, model_size: str) -> str:
+def _iter_transcript(audio_path: Path, model_size: str) -> Iterator[str]:
     """
     Use faster-whisper to auto-detect language and translate to English.
-    Returns transcript text (English).
+    Yields non-empty segment texts (English) as they are decoded; faster-whisper
+    decodes lazily, so callers can consume the start before the end is done.
     """
     try:
-        from faster_whisper import WhisperModel  # type: ignore
+        import faster_whisper  # type: ignore  # noqa: F401
     except ImportError as e:
         raise RuntimeError("faster-whisper is not installed. Run: pip install faster-whisper") from e
 
     device, compute_type = _detect_device_for_faster()
-    model = WhisperModel(model_size, device=device, compute_type=compute_type)
+    model = _get_fw_model(model_size, device, compute_type)
 
     segments, _info = model.transcribe(
         str(audio_path),
         task="translate",   # -> English
         language=None,      # auto-detect
         vad_filter=True,
-        vad_parameters=dict(min_silence_duration_ms=500),
+        vad_parameters=_FW_VAD_PARAMETERS,
     )
 
-    parts = [s.text.strip() for s in segments]
-    return " ".join(p for p in parts if p).strip()
+    for s in segments:
+        text = s.text.strip()
+        if text:
+            yield text
+
+
+def _transcribe_with_faster_whisper(audio_path: Path, model_size: str) -> str:
+    """
+    Use faster-whisper to auto-detect language and translate to English.
+    Returns transcript text (English).
+    """
+    return " ".join(_iter_transcript(audio_path, model_size)).strip()
 
 
 # ------------------- Public API -------------------
@@ -297,18 +381,66 @@ def transcribe_youtube(
         Path to ffmpeg. If omitted, tries imageio-ffmpeg bundled binary, then system PATH.
     keep_temp : bool, default False
         If True, leaves the downloaded audio file in ./yt_transcriber_temp for debugging.
+        This always runs the download and transcription, bypassing the cache.
 
     Returns
     -------
     str
-        The English transcript text.
+        The English transcript text. Cached on disk for a day per
+        (url, engine, model) so repeat requests skip download + transcription.
     """
     if engine not in {"faster-whisper", "whisper"}:
         raise ValueError('engine must be one of: "faster-whisper", "whisper"')
 
+    if keep_temp:
+        # A cache hit would have no audio file to keep
+        return _transcribe_youtube(
+            youtube_url, engine=engine, model=model,
+            ffmpeg_location=ffmpeg_location, keep_temp=True,
+        )
+    return _transcribe_youtube_cached(
+        youtube_url, engine=engine, model=model, ffmpeg_location=ffmpeg_location,
+    )
+
+
+# ffmpeg_location only changes where the binary comes from, not the transcript
+@_CACHE.memoize(expire=_CACHE_EXPIRE_SECONDS, ignore={"ffmpeg_location"})
+def _transcribe_youtube_cached(
+    youtube_url: str,
+    *,
+    engine: str,
+    model: str,
+    ffmpeg_location: Optional[str] = None,
+) -> str:
+    return _transcribe_youtube(
+        youtube_url, engine=engine, model=model,
+        ffmpeg_location=ffmpeg_location, keep_temp=False,
+    )
+
+
+def _transcribe_youtube(
+    youtube_url: str,
+    *,
+    engine: str,
+    model: str,
+    ffmpeg_location: Optional[str],
+    keep_temp: bool,
+) -> str:
     with tempfile.TemporaryDirectory(prefix="yt-transcribe-") as td:
         tmp_dir = Path(td)
-        dl = _download_audio_to_temp(youtube_url, tmp_dir, ffmpeg_location=ffmpeg_location)
+
+        # Download (network-bound) while the model loads (disk-bound) in a thread
+        pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="yt-model-warmup")
+        try:
+            warmup = pool.submit(_warm_model, engine, model)
+            dl = _download_audio_to_temp(youtube_url, tmp_dir, ffmpeg_location=ffmpeg_location)
+            try:
+                # Wait so the model isn't loaded twice; real errors resurface below
+                warmup.result()
+            except Exception as e:
+                logger.debug("Model warm-up failed: %s", e)
+        finally:
+            pool.shutdown(wait=False)
 
         try:
             if engine == "whisper":
@@ -1,3 +1,4 @@
+import asyncio
 from llm_wrapper import prompt_builder, llm_inference
 from information_extraction import youtube_transcriber
 
@@ -6,6 +7,11 @@ def fact_check(paragraph: str | None):
     return llm_inference.generate_response_with_search(prompt)
 
 
+async def fact_check_async(paragraph: str | None):
+    # The OpenAI call is blocking; run it off the event loop
+    return await asyncio.to_thread(fact_check, paragraph)
+
+
 # --- Example usage ---
 if __name__ == "__main__":
     #paragraph = "Coffee dehydrates you. The WHO was founded in 1948."
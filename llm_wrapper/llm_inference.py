@@ -31,8 +31,10 @@ def generate_response_with_search ( prompt: str | None):
     return response.output_text
 
 
-def generate_response_40(prompt: str | None):
-    
+def generate_response_40(prompt: str | None, response_format: dict | None = None):
+    # response_format={"type": "json_object"} makes the model emit valid JSON only
+    extra = {"response_format": response_format} if response_format else {}
+
     response = client.chat.completions.create(
         model="gpt-4o",
         messages=[
@@ -41,7 +43,8 @@ def generate_response_40(prompt: str | None):
         ],
         temperature=0.7,
         max_tokens=2048,
-        top_p=1
+        top_p=1,
+        **extra
     )
     return response.choices[0].message.content
 
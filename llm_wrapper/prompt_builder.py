@@ -172,14 +172,14 @@ def build_prompt_to_extract_Claims(paragraph: str | None):
         - If fewer than 5 clear claims exist, return only the ones that qualify (do not fabricate).
 
         OUTPUT FORMAT (IMPORTANT)
-        - Return a single Python list literal of strings.
-        - Use SINGLE quotes around each claim.
+        - Return a single JSON object: {{"claims": [string, ...]}}
+        - Use DOUBLE quotes (valid JSON); escape any double quotes inside a claim.
         - No numbering, no extra text, no code fences, no trailing comma.
         - Each claim ≤ 25 words and stands alone without needing the paragraph for context.
 
         EXAMPLES
         Paragraph: "City X reports 12 new measles cases; Mayor Jane Doe declares emergency; flights canceled at Airport Y."
-        Output: ['City X reports 12 new measles cases.', 'Mayor Jane Doe declares an emergency in City X.', 'Flights are canceled at Airport Y.']
+        Output: {{"claims": ["City X reports 12 new measles cases.", "Mayor Jane Doe declares an emergency in City X.", "Flights are canceled at Airport Y."]}}
 
         NOW EXTRACT FROM THIS PARAGRAPH
         \"\"\"{paragraph}\"\"\"
@@ -4,6 +4,7 @@ import requests
 import trafilatura
 # from information_extraction import youtube_transcriber
 from information_extraction import yt_transcript_fetcher
+from information_extraction.text_from_web import WEB_CACHE, CACHE_EXPIRE_SECONDS
 
 # from youtube_transcript_api import YouTubeTranscriptApi, TranscriptsDisabled, NoTranscriptFound, VideoUnavailable
 
@@ -20,6 +21,7 @@ def is_youtube(url: str) -> bool:
     host = urlparse(url).netloc.lower()
     return host in YOUTUBE_HOSTS
 
+@WEB_CACHE.memoize(expire=CACHE_EXPIRE_SECONDS)
 def fetch_text_from_article(url: str) -> str:
     downloaded = trafilatura.fetch_url(url)
     if not downloaded:
@@ -35,6 +37,19 @@ def fetch_text_from_article(url: str) -> str:
         raise ValueError("Failed to extract article text from this URL.")
     return extracted
 
+def fetch_youtube_transcript(video_id: str) -> dict | None:
+    """
+    Caption transcript for a video id (see yt_transcript_fetcher), cached in
+    WEB_CACHE. Failures (None) are not cached so they are retried next time.
+    """
+    key = ("youtube_transcript", video_id)
+    result = WEB_CACHE.get(key)
+    if result is None:
+        result = yt_transcript_fetcher.get_youtube_transcript_any(video_id)
+        if result is not None:
+            WEB_CACHE.set(key, result, expire=CACHE_EXPIRE_SECONDS)
+    return result
+
 def normalize_whitespace(s: str) -> str:
     return re.sub(r"\s+", " ", (s or "")).strip()
 
@@ -91,7 +106,7 @@ def process_input(user_input: str) -> tuple[str, dict, list[str]]:
             # )
             text = ""
             vid = yt_transcript_fetcher.extract_video_id(user_input)
-            result = yt_transcript_fetcher.get_youtube_transcript_any(vid)
+            result = fetch_youtube_transcript(vid)
             text = result["transcript"]
         else:
             text = fetch_text_from_article(user_input)